@@ -4,6 +4,7 @@ import os
 from importlib import metadata
 
 import jwt
+import pydantic
 import uvicorn
 from dotenv import find_dotenv, load_dotenv
 from fastapi import FastAPI, HTTPException, Request, Response
@@ -215,6 +216,11 @@ def get_app(
 
     @app.on_event("startup")
     async def on_startup():
+        # the models validation (e.g. AlertDto on every event) relies on the cython compiled pydantic wheels
+        if not pydantic.compiled:
+            logger.warning(
+                "pydantic is not compiled with cython, models validation will be slower"
+            )
         # load all providers into cache
         from keep.providers.providers_factory import ProvidersFactory
 
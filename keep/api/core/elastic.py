@@ -4,7 +4,7 @@ import os
 from elasticsearch import BadRequestError, Elasticsearch
 from elasticsearch.helpers import bulk
 
-from keep.api.models.alert import AlertDto, AlertSeverity
+from keep.api.models.alert import AlertDto, AlertSeverity, severity_order
 from keep.rulesengine.rulesengine import RulesEngine
 
 
@@ -179,7 +179,7 @@ class ElasticClient:
 
         try:
             # change severity to number so we can sort by it
-            alert.severity = AlertSeverity(alert.severity.lower()).order
+            alert.severity = severity_order(alert.severity.lower())
             # query
             self._client.index(
                 index=f"keep-alerts-{tenant_id}",
@@ -204,9 +204,9 @@ class ElasticClient:
                 "_source": alert.dict(),
             }
             # change severity to number so we can sort by it
-            action["_source"]["severity"] = AlertSeverity(
+            action["_source"]["severity"] = severity_order(
                 action["_source"]["severity"].lower()
-            ).order
+            )
             actions.append(action)
 
         try:
@@ -1,15 +1,59 @@
+import contextlib
+import contextvars
 import datetime
+import functools
 import hashlib
 import json
 import logging
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Literal
 
 from pydantic import AnyHttpUrl, BaseModel, Extra, root_validator, validator
 
 logger = logging.getLogger(__name__)
 
+# bound once, the fingerprint validator runs for every alert
+_sha256 = hashlib.sha256
+_json_dumps = json.dumps
 
+# "now" pinned by batch callers (see batch_now) so validators don't hit the clock per alert
+_batch_now: contextvars.ContextVar[datetime.datetime | None] = contextvars.ContextVar(
+    "alert_batch_now", default=None
+)
+
+
+def _now_utc() -> datetime.datetime:
+    return _batch_now.get() or datetime.datetime.now(datetime.timezone.utc)
+
+
+@contextlib.contextmanager
+def batch_now(now: datetime.datetime | None = None):
+    """
+    Pin the current UTC time for every AlertDto validated inside the block.
+
+    Args:
+        now (datetime.datetime | None): The time to use, defaults to the current UTC time.
+    """
+    token = _batch_now.set(now or datetime.datetime.now(datetime.timezone.utc))
+    try:
+        yield
+    finally:
+        _batch_now.reset(token)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dismiss_until(dismiss_until: str) -> datetime.datetime:
+    # many alerts share the same dismissUntil (e.g. dismissed together), so cache the parsing
+    # fromisoformat is implemented in C and handles the trailing "Z" (python>=3.11)
+    dismiss_until_datetime = datetime.datetime.fromisoformat(dismiss_until)
+    if dismiss_until_datetime.tzinfo is None:
+        dismiss_until_datetime = dismiss_until_datetime.replace(
+            tzinfo=datetime.timezone.utc
+        )
+    return dismiss_until_datetime
+
+
+@functools.total_ordering
 class AlertSeverity(Enum):
     CRITICAL = ("critical", 5)
     HIGH = ("high", 4)
@@ -32,30 +76,35 @@ class AlertSeverity(Enum):
 
     @classmethod
     def from_number(cls, n):
-        for severity in cls:
-            if severity.order == n:
-                return severity
-        raise ValueError(f"No AlertSeverity with order {n}")
+        try:
+            return cls._by_order[n]
+        except KeyError:
+            raise ValueError(f"No AlertSeverity with order {n}")
 
     def __lt__(self, other):
+        # the remaining comparisons are derived by total_ordering; for bulk
+        # sorting prefer key=lambda severity: severity.severity_order
         if isinstance(other, AlertSeverity):
-            return self.order < other.order
+            return self.severity_order < other.severity_order
         return NotImplemented
 
-    def __le__(self, other):
-        if isinstance(other, AlertSeverity):
-            return self.order <= other.order
-        return NotImplemented
 
-    def __gt__(self, other):
-        if isinstance(other, AlertSeverity):
-            return self.order > other.order
-        return NotImplemented
+AlertSeverity._by_order = {severity.order: severity for severity in AlertSeverity}
+_SEVERITY_BY_VALUE = {severity.value: severity for severity in AlertSeverity}
+_SEVERITY_ORDER_BY_VALUE = {
+    severity.value: severity.severity_order for severity in AlertSeverity
+}
 
-    def __ge__(self, other):
-        if isinstance(other, AlertSeverity):
-            return self.order >= other.order
-        return NotImplemented
+# AlertDto keeps the plain values, validating a Literal is a cheap membership check
+AlertSeverityValue = Literal["critical", "high", "warning", "info", "low"]
+
+
+def severity_order(severity: str) -> int:
+    """Get the order of a severity value (e.g. "critical" -> 5)."""
+    try:
+        return _SEVERITY_ORDER_BY_VALUE[severity]
+    except KeyError:
+        raise ValueError(f"Invalid severity {severity}")
 
 
 class AlertStatus(Enum):
@@ -71,11 +120,18 @@ class AlertStatus(Enum):
     PENDING = "pending"
 
 
+_STATUS_BY_VALUE = {status.value: status for status in AlertStatus}
+
+AlertStatusValue = Literal[
+    "firing", "resolved", "acknowledged", "suppressed", "pending"
+]
+
+
 class AlertDto(BaseModel):
     id: str
     name: str
-    status: AlertStatus
-    severity: AlertSeverity
+    status: AlertStatusValue
+    severity: AlertSeverityValue
     lastReceived: str
     environment: str = "undefined"
     isDuplicate: bool | None = None
@@ -107,42 +163,88 @@ class AlertDto(BaseModel):
     )
     isNoisy: bool = False  # Whether the alert is noisy
 
+    # Fields to exclude from comparison since they are bit different in different db's
+    _eq_exclude = frozenset({"lastReceived", "startedAt", "event_id"})
+
     def __str__(self) -> str:
-        # Convert the model instance to a dictionary
-        model_dict = self.dict()
-        return json.dumps(model_dict, indent=4, default=str)
+        # pydantic's json() exports and encodes in one go (enums via Config.json_encoders)
+        return self.json(indent=4, encoder=self._str_encoder)
+
+    def _str_encoder(self, value: Any) -> Any:
+        # extra attributes can be anything, so fall back to str() like json.dumps(default=str)
+        try:
+            return self.__json_encoder__(value)
+        except TypeError:
+            return str(value)
+
+    def __repr__(self) -> str:
+        # keep it short and cheap, repr is what ends up in most log lines
+        return (
+            f"AlertDto(id={self.id!r}, fingerprint={self.fingerprint!r}, "
+            f"status={self.status!r}, severity={self.severity!r})"
+        )
 
     def __eq__(self, other):
         if isinstance(other, AlertDto):
-            # Convert both instances to dictionaries
-            dict_self = self.dict()
-            dict_other = other.dict()
-
-            # Fields to exclude from comparison since they are bit different in different db's
-            exclude_fields = {"lastReceived", "startedAt", "event_id"}
-
-            # Remove excluded fields from both dictionaries
-            for field in exclude_fields:
-                dict_self.pop(field, None)
-                dict_other.pop(field, None)
-
-            # Compare the dictionaries
-            return dict_self == dict_other
+            self_values = self.__dict__
+            other_values = other.__dict__
+            # Extra (non-declared) fields live in __dict__ too, so both sides must carry the same keys
+            if (self_values.keys() ^ other_values.keys()) - self._eq_exclude:
+                return False
+            # Compare field by field, bailing out on the first mismatch
+            for name, value in self_values.items():
+                if name in self._eq_exclude:
+                    continue
+                if value != other_values[name]:
+                    return False
+            return True
         return False
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    @classmethod
+    def construct_trusted(cls, **data) -> "AlertDto":
+        """
+        Build an AlertDto from already validated data (e.g. another AlertDto's .dict()),
+        skipping the validators.
+
+        Only the enum fields are normalized, so the result matches a validated instance.
+        """
+        severity = data.get("severity")
+        if isinstance(severity, AlertSeverity):
+            data["severity"] = severity.value
+        status = data.get("status")
+        if isinstance(status, AlertStatus):
+            data["status"] = status.value
+        return cls.construct(**data)
+
+    @classmethod
+    def parse_batch(cls, events: list[dict]) -> list["AlertDto"]:
+        """
+        Validate a batch of alert payloads, all against the same "now" (see batch_now).
+
+        Args:
+            events (list[dict]): The alert payloads.
+
+        Returns:
+            list[AlertDto]: The validated alerts.
+        """
+        with batch_now():
+            return [cls(**event) for event in events]
+
     @validator("fingerprint", pre=True, always=True)
     def assign_fingerprint_if_none(cls, fingerprint, values):
         # if its none, use the name
         if fingerprint is None:
-            fingerprint_payload = values.get("name")
+            name = values.get("name")
+            if name:
+                fingerprint_payload = name.encode()
             # if the alert name is None, than use the entire payload
-            if not fingerprint_payload:
+            else:
                 logger.warning("No name to alert, using the entire payload")
-                fingerprint_payload = json.dumps(values)
-            fingerprint = hashlib.sha256(fingerprint_payload.encode()).hexdigest()
+                fingerprint_payload = _json_dumps(values).encode()
+            fingerprint = _sha256(fingerprint_payload).hexdigest()
         # take only the first 255 characters
         else:
             fingerprint = fingerprint[:255]
@@ -158,11 +260,15 @@ class AlertDto(BaseModel):
     @validator("lastReceived", pre=True, always=True)
     def validate_last_received(cls, last_received, values):
         if not last_received:
-            last_received = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            last_received = _now_utc().isoformat()
         return last_received
 
     @validator("dismissed", pre=True, always=True)
     def validate_dismissed(cls, dismissed, values):
+        # fast path, most alerts are not dismissed
+        if dismissed is False:
+            return dismissed
+
         # normzlize dismissed value
         if isinstance(dismissed, str):
             dismissed = dismissed.lower() == "true"
@@ -178,49 +284,57 @@ class AlertDto(BaseModel):
             return dismissed
 
         # if there's dismissUntil, validate it
-        dismiss_until_datetime = datetime.datetime.strptime(
-            dismiss_until, "%Y-%m-%dT%H:%M:%S.%fZ"
-        ).replace(tzinfo=datetime.timezone.utc)
-        dismissed = (
-            datetime.datetime.now(datetime.timezone.utc) < dismiss_until_datetime
-        )
+        dismissed = _now_utc() < _parse_dismiss_until(dismiss_until)
         return dismissed
 
     @root_validator(pre=True)
     def set_default_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         # Check and set default severity
         severity = values.get("severity")
-        try:
-            # if severity is int, convert it to AlertSeverity
-            if isinstance(severity, int):
-                values["severity"] = AlertSeverity.from_number(severity)
-            else:
-                values["severity"] = AlertSeverity(severity)
-        except ValueError:
+        if isinstance(severity, AlertSeverity):
+            alert_severity = severity
+        # if severity is int, convert it to AlertSeverity
+        elif isinstance(severity, int):
+            alert_severity = AlertSeverity._by_order.get(severity)
+        elif isinstance(severity, str):
+            alert_severity = _SEVERITY_BY_VALUE.get(severity)
+        else:
+            alert_severity = None
+        if alert_severity is None:
             logging.warning(
                 f"Invalid severity value: {severity}, setting default.",
                 extra={"event": values},
             )
-            values["severity"] = AlertSeverity.INFO
+            alert_severity = AlertSeverity.INFO
+        values["severity"] = alert_severity.value
 
         # Check and set default status
         status = values.get("status")
-        try:
-            values["status"] = AlertStatus(status)
-        except ValueError:
+        if isinstance(status, AlertStatus):
+            alert_status = status
+        elif isinstance(status, str):
+            alert_status = _STATUS_BY_VALUE.get(status)
+        else:
+            alert_status = None
+        if alert_status is None:
             logging.warning(
                 f"Invalid status value: {status}, setting default.",
                 extra={"event": values},
             )
-            values["status"] = AlertStatus.FIRING
+            alert_status = AlertStatus.FIRING
+        values["status"] = alert_status.value
 
         # this is code duplication of enrichment_helpers.py and should be refactored
         lastReceived = values["lastReceived"]
         assignees = values.pop("assignees", None)
         if assignees:
-            dt = datetime.datetime.fromisoformat(lastReceived)
-            dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-            assignee = assignees.get(lastReceived) or assignees.get(dt)
+            assignee = assignees.get(lastReceived)
+            if not assignee:
+                dt = datetime.datetime.fromisoformat(lastReceived)
+                normalized_key = dt.isoformat(timespec="milliseconds").replace(
+                    "+00:00", "Z"
+                )
+                assignee = assignees.get(normalized_key)
             values["assignee"] = assignee
         values.pop("deletedAt", None)
         return values
@@ -232,11 +346,13 @@ class AlertDto(BaseModel):
         # note this is happen AFTER validate_dismissed which already consider
         #   dismissed + dismissUntil
         if values.get("dismissed"):
-            values["status"] = AlertStatus.SUPPRESSED
+            values["status"] = AlertStatus.SUPPRESSED.value
         return values
 
     class Config:
         extra = Extra.allow
+        # don't deep copy an AlertDto when it's embedded in another model
+        copy_on_model_validation = "none"
         schema_extra = {
             "examples": [
                 {
@@ -261,7 +377,6 @@ class AlertDto(BaseModel):
                 }
             ]
         }
-        use_enum_values = True
         json_encoders = {
             # Converts enums to their values for JSON serialization
             Enum: lambda v: v.value,
@@ -273,6 +388,9 @@ class DeleteRequestBody(BaseModel):
     lastReceived: str
     restore: bool = False
 
+    class Config:
+        allow_mutation = False
+
 
 class DismissRequestBody(BaseModel):
     fingerprint: str
@@ -280,7 +398,13 @@ class DismissRequestBody(BaseModel):
     dismissComment: str
     restore: bool = False
 
+    class Config:
+        allow_mutation = False
+
 
 class EnrichAlertRequestBody(BaseModel):
     enrichments: dict[str, str]
     fingerprint: str
+
+    class Config:
+        allow_mutation = False
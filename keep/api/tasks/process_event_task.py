@@ -109,7 +109,8 @@ def __save_to_db(
             session.flush()
             session.refresh(alert)
             formatted_event.event_id = str(alert.id)
-            alert_dto = AlertDto(**formatted_event.dict())
+            # formatted_event was already validated, no need to run the validators again
+            alert_dto = AlertDto.construct_trusted(**formatted_event.dict())
 
             # Mapping
             try:
@@ -3,7 +3,7 @@ from datetime import datetime
 
 from opentelemetry import trace
 
-from keep.api.models.alert import AlertDto
+from keep.api.models.alert import AlertDto, batch_now
 from keep.api.models.db.alert import Alert
 
 tracer = trace.get_tracer(__name__)
@@ -51,7 +51,8 @@ def convert_db_alerts_to_dto_alerts(alerts: list[Alert]) -> list[AlertDto]:
         list[AlertDto]: The enriched alerts.
     """
     alerts_dto = []
-    with tracer.start_as_current_span("alerts_enrichment"):
+    # validate the whole batch against a single "now"
+    with tracer.start_as_current_span("alerts_enrichment"), batch_now():
         # enrich the alerts with the enrichment data
         for alert in alerts:
             if alert.alert_enrichment:
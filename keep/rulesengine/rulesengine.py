@@ -9,7 +9,12 @@ import chevron
 from keep.api.core.db import assign_alert_to_group as assign_alert_to_group_db
 from keep.api.core.db import create_alert as create_alert_db
 from keep.api.core.db import get_rules as get_rules_db
-from keep.api.models.alert import AlertDto, AlertSeverity, AlertStatus
+from keep.api.models.alert import (
+    AlertDto,
+    AlertSeverity,
+    AlertStatus,
+    severity_order,
+)
 from keep.api.models.group import GroupDto
 
 
@@ -40,7 +45,7 @@ class RulesEngine:
         ]
         # if all alerts are with the same status, just use it
         severities = [AlertSeverity(alert.event["severity"]) for alert in alerts]
-        max_severity = max(severities, key=lambda severity: severity.order)
+        max_severity = max(severities, key=lambda severity: severity.severity_order)
         return str(max_severity)
 
     def run_rules(self, events: list[AlertDto]):
@@ -157,7 +162,7 @@ class RulesEngine:
             grouped_alerts.append(group_alert)
             self.logger.info(f"Created alert {group_alert.id} for group {group.id}")
         self.logger.info(f"Rules ran, {len(grouped_alerts)} alerts created")
-        alerts_dto = [AlertDto(**alert.event) for alert in grouped_alerts]
+        alerts_dto = AlertDto.parse_batch([alert.event for alert in grouped_alerts])
         return alerts_dto
 
     def _extract_subrules(self, expression):
@@ -332,16 +337,8 @@ class RulesEngine:
 
             # Handle severity-specific replacement
             if field_name.lower() == "severity":
-                severity_order = next(
-                    (
-                        severity.order
-                        for severity in AlertSeverity
-                        if severity.value == matched_value.lower()
-                    ),
-                    None,
-                )
-                if severity_order is not None:
-                    return f"{field_name} {operator} {severity_order}"
+                matched_order = severity_order(matched_value.lower())
+                return f"{field_name} {operator} {matched_order}"
 
             # Return the original match if it's not a severity comparison or if no replacement is necessary
             return match.group(0)
@@ -379,7 +376,7 @@ class RulesEngine:
             # TODO: workaround since source is a list
             #       should be fixed in the future
             payload["source"] = ",".join(payload["source"])
-            payload["severity"] = AlertSeverity(payload["severity"].lower()).order
+            payload["severity"] = severity_order(payload["severity"].lower())
 
             activation = celpy.json_to_cel(json.loads(json.dumps(payload, default=str)))
             try:
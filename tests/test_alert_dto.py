@@ -1,6 +1,9 @@
+import datetime
 import hashlib
 
-from keep.api.models.alert import AlertDto
+import pytest
+
+from keep.api.models.alert import AlertDto, AlertSeverity, severity_order
 
 
 def test_alert_dto_fingerprint_none():
@@ -23,3 +26,153 @@ def test_alert_dto_fingerprint_none():
         url="https://www.google.com/search?q=open+source+alert+management",
     )
     assert alert_dto.fingerprint == hashlib.sha256(name.encode()).hexdigest()
+
+
+def test_alert_dto_eq_ignores_db_specific_fields():
+    alert_dto = AlertDto(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+        lastReceived="2021-01-01T00:00:00.000Z",
+        event_id="1234",
+        ticket_url="https://www.keephq.dev?enrichedTicketId=456",
+    )
+    other = alert_dto.copy(
+        update={"lastReceived": "2021-01-01T00:00:00.000000", "event_id": "5678"}
+    )
+    assert alert_dto == other
+    assert alert_dto != alert_dto.copy(update={"status": "resolved"})
+    assert alert_dto != alert_dto.copy(update={"ticket_url": None})
+
+
+def test_alert_dto_dismiss_until():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    future = (now + datetime.timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    past = (now - datetime.timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    alert_args = dict(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+        lastReceived="2021-01-01T00:00:00.000Z",
+        dismissed=True,
+    )
+    alert_dto = AlertDto(**alert_args, dismissUntil=future)
+    assert alert_dto.dismissed is True
+    assert alert_dto.status == "suppressed"
+
+    alert_dto = AlertDto(**alert_args, dismissUntil=past)
+    assert alert_dto.dismissed is False
+    assert alert_dto.status == "firing"
+
+
+def test_alert_dto_construct_trusted():
+    alert_dto = AlertDto(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+        lastReceived="2021-01-01T00:00:00.000Z",
+        labels={"key": "value"},
+        ticket_url="https://www.keephq.dev?enrichedTicketId=456",
+    )
+    trusted_alert_dto = AlertDto.construct_trusted(**alert_dto.dict())
+    assert trusted_alert_dto == AlertDto(**alert_dto.dict())
+    assert trusted_alert_dto.status == "firing"
+    assert trusted_alert_dto.severity == "critical"
+
+
+def test_alert_dto_assignees():
+    alert_args = dict(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+    )
+    alert_dto = AlertDto(
+        **alert_args,
+        lastReceived="2021-01-01T00:00:00.000Z",
+        assignees={"2021-01-01T00:00:00.000Z": "keep@keephq.dev"},
+    )
+    assert alert_dto.assignee == "keep@keephq.dev"
+
+    alert_dto = AlertDto(
+        **alert_args,
+        lastReceived="2021-01-01T00:00:00+00:00",
+        assignees={"2021-01-01T00:00:00.000Z": "keep@keephq.dev"},
+    )
+    assert alert_dto.assignee == "keep@keephq.dev"
+
+
+def test_alert_dto_parse_batch():
+    alert_dtos = AlertDto.parse_batch(
+        [
+            {
+                "id": "1",
+                "name": "first",
+                "status": "firing",
+                "severity": "high",
+                "lastReceived": None,
+            },
+            {
+                "id": "2",
+                "name": "second",
+                "status": "resolved",
+                "severity": 1,
+                "lastReceived": None,
+            },
+        ]
+    )
+    assert [alert_dto.severity for alert_dto in alert_dtos] == ["high", "low"]
+    # both alerts were validated against the same "now"
+    assert alert_dtos[0].lastReceived == alert_dtos[1].lastReceived
+
+
+def test_alert_severity_ordering():
+    assert AlertSeverity.LOW < AlertSeverity.CRITICAL
+    assert AlertSeverity.HIGH <= AlertSeverity.HIGH
+    assert AlertSeverity.WARNING > AlertSeverity.INFO
+    assert AlertSeverity.CRITICAL >= AlertSeverity.HIGH
+    assert not AlertSeverity.LOW >= AlertSeverity.WARNING
+    with pytest.raises(TypeError):
+        AlertSeverity.LOW < 3
+    with pytest.raises(TypeError):
+        AlertSeverity.LOW >= "low"
+
+
+def test_alert_dto_str_with_non_json_extra():
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    alert_dto = AlertDto(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+        lastReceived="2021-01-01T00:00:00.000Z",
+    )
+    alert_dto.custom = Custom()
+    assert '"custom": "custom"' in str(alert_dto)
+
+
+def test_severity_order():
+    assert severity_order("critical") == AlertSeverity.CRITICAL.order
+    with pytest.raises(ValueError):
+        severity_order("bogus")
+
+
+def test_alert_dto_repr():
+    alert_dto = AlertDto(
+        id="1234",
+        name="Alert name",
+        status="firing",
+        severity="critical",
+        lastReceived="2021-01-01T00:00:00.000Z",
+        fingerprint="fingerprint",
+    )
+    assert repr(alert_dto) == (
+        "AlertDto(id='1234', fingerprint='fingerprint', "
+        "status='firing', severity='critical')"
+    )